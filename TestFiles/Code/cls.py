@@ -1,67 +1,83 @@
+import sys
+
+import numpy as np
+
+# Convert grades to a float array and range-check them in one vectorized pass.
+# Grades are stored as float32 (4 bytes each, packed contiguously) rather
+# than as a list of Python floats; averages are still accumulated in float64
+def to_grade_array(grades):
+    arr = np.asarray(grades)
+    if arr.ndim != 1 or arr.dtype.kind not in "biuf":
+        raise ValueError("Grades must be numbers between 0 and 100.")
+    arr = arr.astype(np.float64)
+    if not ((arr >= 0) & (arr <= 100)).all():
+        raise ValueError("Grades must be numbers between 0 and 100.")
+    return arr.astype(np.float32)
+
 class Student:
     def __init__(self, name, age, grades):
         if not isinstance(age, int) or age <= 0:
             raise ValueError("Age must be a positive integer.")
-        if not all(isinstance(g, (int, float)) and 0 <= g <= 100 for g in grades):
-            raise ValueError("Grades must be numbers between 0 and 100.")
 
+        self.grades = grades
         self.name = name
+        self._key = name.lower()
         self.age = age
-        self.grades = grades
+
+    @property
+    def grades(self):
+        return self._grades
+
+    # Assigning grades validates them and drops the cached average
+    @grades.setter
+    def grades(self, grades):
+        self._grades = to_grade_array(grades)
+        self._avg = None
 
     def average_grade(self):
-        return sum(self.grades) / len(self.grades) if self.grades else 0
+        if self._avg is None:
+            self._avg = float(self._grades.mean(dtype=np.float64)) if self._grades.size else 0.0
+        return self._avg
 
     def display(self):
-        print(f"Name: {self.name}, Age: {self.age}, Grades: {self.grades}, Average: {self.average_grade():.2f}")
+        average = self.average_grade()
+        # str() of a float32 is its shortest repr, so 87.3 prints as 87.3
+        grades = [float(str(g)) for g in self.grades]
+        print(f"Name: {self.name}, Age: {self.age}, Grades: {grades}, Average: {average:.2f}")
 
-# In-memory list to store Student objects
-students = []
+# In-memory store of Student objects, keyed by lowercase name
+students_by_name = {}
 
 # Utility function to find a student by name
 def find_student(name):
-    for student in students:
-        if student.name.lower() == name.lower():
-            return student
-    return None
+    return students_by_name.get(name.lower())
 
-def add_student():
-    try:
-        name = input("Enter name: ")
-        age = int(input("Enter age: "))
-        grades = list(map(float, input("Enter grades (space-separated): ").split()))
-        student = Student(name, age, grades)
-        students.append(student)
-        print(f"Student '{name}' added.")
-    except ValueError as ve:
-        print("Error:", ve)
+# Operations take already-parsed arguments so they can be driven by the
+# interactive prompts below or by a scripted command stream
+def add_student(name, age, grades):
+    if find_student(name):
+        raise ValueError(f"Student '{name}' already exists.")
+    student = Student(name, age, grades)
+    students_by_name[student._key] = student
+    print(f"Student '{name}' added.")
 
-def update_student():
-    name = input("Enter name of student to update: ")
+def update_student(name, age, grades):
     student = find_student(name)
-    if student:
-        try:
-            age = int(input("Enter new age: "))
-            grades = list(map(float, input("Enter new grades: ").split()))
-            student.age = age
-            student.grades = grades
-            print(f"Student '{name}' updated.")
-        except ValueError as ve:
-            print("Error:", ve)
-    else:
+    if not student:
         print("Student not found.")
+        return
+    student.grades = grades
+    student.age = age
+    print(f"Student '{name}' updated.")
 
-def delete_student():
-    name = input("Enter name of student to delete: ")
-    student = find_student(name)
+def delete_student(name):
+    student = students_by_name.pop(name.lower(), None)
     if student:
-        students.remove(student)
         print(f"Student '{name}' deleted.")
     else:
         print("Student not found.")
 
-def view_student():
-    name = input("Enter name of student to view: ")
+def view_student(name):
     student = find_student(name)
     if student:
         student.display()
@@ -69,39 +85,107 @@ def view_student():
         print("Student not found.")
 
 def list_students():
-    if not students:
+    if not students_by_name:
         print("No students in the system.")
     else:
-        for student in students:
+        # Averages are cached per student; compute the missing ones by
+        # flattening their grades into one buffer (CSR-style, with a row id
+        # per grade) and reducing them all at once
+        roster = list(students_by_name.values())
+        stale = [s for s in roster if s._avg is None]
+        if stale:
+            counts = np.fromiter((s.grades.size for s in stale), dtype=np.intp, count=len(stale))
+            flat = np.concatenate([s.grades for s in stale])
+            rows = np.repeat(np.arange(len(stale)), counts)
+            sums = np.bincount(rows, weights=flat, minlength=len(stale))
+            for student, average in zip(stale, (sums / np.maximum(counts, 1)).tolist()):
+                student._avg = average
+        for student in roster:
             student.display()
 
+# Menu handlers: each reads its own arguments through `read`, which is
+# input() interactively or the next line of a batch script. In batch mode a
+# handler always reads every argument line before validating, so a rejected
+# command never leaves its remaining lines to be taken as menu choices
+def prompt_add_student(read, interactive):
+    name = read("Enter name: ")
+    age = read("Enter age: ")
+    grades = read("Enter grades (space-separated): ")
+    try:
+        add_student(name, int(age), list(map(float, grades.split())))
+    except ValueError as ve:
+        print("Error:", ve)
+
+def prompt_update_student(read, interactive):
+    name = read("Enter name of student to update: ")
+    if interactive and not find_student(name):
+        print("Student not found.")
+        return
+    age = read("Enter new age: ")
+    grades = read("Enter new grades: ")
+    try:
+        update_student(name, int(age), list(map(float, grades.split())))
+    except ValueError as ve:
+        print("Error:", ve)
+
+def prompt_delete_student(read, interactive):
+    delete_student(read("Enter name of student to delete: "))
+
+def prompt_view_student(read, interactive):
+    view_student(read("Enter name of student to view: "))
+
+def prompt_list_students(read, interactive):
+    list_students()
+
+def invalid_choice(read, interactive):
+    print("Invalid choice. Please enter 1-6.")
+
+DISPATCH = {
+    "1": prompt_add_student,
+    "2": prompt_update_student,
+    "3": prompt_delete_student,
+    "4": prompt_view_student,
+    "5": prompt_list_students,
+}
+
+def run(read, interactive=True):
+    try:
+        while True:
+            if interactive:
+                print("\n===== Student Records Menu =====")
+                print("1. Add Student")
+                print("2. Update Student")
+                print("3. Delete Student")
+                print("4. View Student")
+                print("5. List All Students")
+                print("6. Exit")
+            choice = read("Enter your choice: ").strip()
+            if choice == "6":
+                print("Exiting...")
+                break
+            DISPATCH.get(choice, invalid_choice)(read, interactive)
+    except EOFError:
+        pass
+
 def menu():
-    while True:
-        print("\n===== Student Records Menu =====")
-        print("1. Add Student")
-        print("2. Update Student")
-        print("3. Delete Student")
-        print("4. View Student")
-        print("5. List All Students")
-        print("6. Exit")
-        choice = input("Enter your choice: ")
-
-        if choice == "1":
-            add_student()
-        elif choice == "2":
-            update_student()
-        elif choice == "3":
-            delete_student()
-        elif choice == "4":
-            view_student()
-        elif choice == "5":
-            list_students()
-        elif choice == "6":
-            print("Exiting...")
-            break
-        else:
-            print("Invalid choice. Please enter 1-6.")
+    run(input)
+
+# Run a whole script of menu answers (one per line, as they would be typed)
+# without prompts or per-line readline calls
+def run_batch(lines):
+    lines = iter(lines)
+
+    def read(prompt=""):
+        try:
+            return next(lines)
+        except StopIteration:
+            raise EOFError from None
+
+    run(read, interactive=False)
 
 # Run the app
 if __name__ == "__main__":
-    menu()
+    if sys.stdin.isatty():
+        menu()
+    else:
+        run_batch(sys.stdin.read().splitlines())
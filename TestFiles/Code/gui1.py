@@ -1,15 +1,101 @@
 import tkinter as tk
+import operator
+from functools import lru_cache
+import re
+# binary operators: (precedence, right-associative, function), as in Python
+OPS={'+':(1,False,operator.add),'-':(1,False,operator.sub),
+     '*':(2,False,operator.mul),'/':(2,False,operator.truediv),'//':(2,False,operator.floordiv),
+     '**':(4,True,operator.pow)}
+# unary signs bind tighter than * but looser than **, so -2**2 == -4
+UNARY={'u-':(3,True,operator.neg),'u+':(3,True,operator.pos)}
+ALLOWED=str.maketrans("","","0123456789.eE+-*/ ")
+TOKEN=re.compile(r"\s*(?:((?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?)|(\*\*|//|[-+*/]))")
+def _number(s):
+    return int(s) if s.isdigit() else float(s)
+def _tokenize(s):
+    if s.translate(ALLOWED):
+        raise ValueError("invalid character")
+    tokens=[]
+    operand=True  # an operand (or a unary sign) is expected next
+    pos=0
+    s=s.rstrip()
+    while pos<len(s):
+        m=TOKEN.match(s,pos)
+        if not m:
+            raise ValueError("invalid expression")
+        pos=m.end()
+        num,op=m.groups()
+        if num is not None:
+            if not operand:
+                raise ValueError("missing operator")
+            tokens.append(("num",_number(num)))
+            operand=False
+        elif operand:
+            # unary sign, e.g. "-5" or "2*-3"
+            if op not in "+-":
+                raise ValueError("missing operand")
+            tokens.append(("op","u"+op))
+        else:
+            tokens.append(("op",op))
+            operand=True
+    if operand:
+        raise ValueError("missing operand")
+    return tokens
+def _eval_rpn(tokens):
+    # shunting-yard to postfix, then evaluate the postfix with a value stack
+    out=[]
+    stack=[]
+    for kind,val in tokens:
+        if kind=="num":
+            out.append(val)
+        elif val in UNARY:
+            # prefix operators have nothing on their left to reduce
+            stack.append(val)
+        else:
+            prec,right,_=OPS[val]
+            while stack:
+                top=(OPS.get(stack[-1]) or UNARY[stack[-1]])[0]
+                if top>prec or (top==prec and not right):
+                    out.append(stack.pop())
+                else:
+                    break
+            stack.append(val)
+    out.extend(reversed(stack))
+    vals=[]
+    for t in out:
+        if t in UNARY:
+            vals.append(UNARY[t][2](vals.pop()))
+        elif t in OPS:
+            b=vals.pop()
+            a=vals.pop()
+            vals.append(OPS[t][2](a,b))
+        else:
+            vals.append(t)
+    return vals[0]
+@lru_cache(maxsize=128)
+def evaluate(expr):
+    return _eval_rpn(_tokenize(expr))
 def click(i):
     if(i== "="):
         cal()
     else:
         result.insert(tk.END,i)
 def cal():
-    ans=eval(result.get())
+    try:
+        ans=evaluate(result.get())
+    except (ValueError,ZeroDivisionError,OverflowError):
+        root.bell()
+        return
     result.delete(0,tk.END)
     result.insert(tk.END,ans)
 def clear():
     result.delete(0,tk.END)
+def hit(ev):
+    # one binding for the whole keypad: map the click position to a key
+    r=ev.y//CELL_H
+    c=ev.x//CELL_W
+    if 0<=r<len(KEYS) and 0<=c<len(KEYS[r]):
+        click(KEYS[r][c])
 
 root=tk.Tk()
 root.title("Calculator")
@@ -17,18 +103,17 @@ root.geometry("400x600")
 root.configure(bg="grey")
 result=tk.Entry(root, text="0", font=("Arial", 24), bg="white", width=15)
 result.pack(pady=20)
-l=['9','8','7','6','5','4','3','2','1','0','.','+','-','*','/','=']
-p=tk.Frame(root)
-p.configure(bg="grey")
-r=0
-c=0
-for i in l:
-    btn=tk.Button(p,text=i,height=2,width=5,font=("Arial",20),command=lambda i=i:click(i))
-    btn.grid(row=r,column=c,padx=5,pady=5)
-    c+=1
-    if c==4:
-        r+=1
-        c=0
+KEYS=(('9','8','7','6'),('5','4','3','2'),('1','0','.','+'),('-','*','/','='))
+CELL_W=90
+CELL_H=80
+p=tk.Canvas(root,width=CELL_W*4,height=CELL_H*4,bg="grey",highlightthickness=0)
+for r,row in enumerate(KEYS):
+    for c,i in enumerate(row):
+        x=c*CELL_W
+        y=r*CELL_H
+        p.create_rectangle(x+5,y+5,x+CELL_W-5,y+CELL_H-5,fill="#f0f0f0",outline="black")
+        p.create_text(x+CELL_W//2,y+CELL_H//2,text=i,font=("Arial",20))
+p.bind("<Button-1>",hit)
 p.pack()
 btn=tk.Button(root,text="CLR",height=2,width=23,font=("Arial",20),command=clear)
 btn.pack(pady=5)
@@ -1,22 +1,33 @@
 import tkinter as tk
-import time
-y=time.localtime().tm_year
-x=time.localtime().tm_mon
-da=time.localtime().tm_mday
+import datetime as dt
+from calendar import monthrange
+today=dt.date.today()
+def refresh_today():
+    global today
+    today=dt.date.today()
+    root.after(3600_000,refresh_today)
+def add_months(d,n):
+    # same day n months later, clamped to the end of a shorter month
+    y,m=divmod(d.year*12+d.month-1+n,12)
+    return dt.date(y,m+1,min(d.day,monthrange(y,m+1)[1]))
 def cal():
-    i=date.get()
-    d=i.split("-")
-    agee=y-int(d[2])
-    if x>int(d[1]):
-        month=x-int(d[1])
-    else:
-        agee-=1
-        month=int(d[1])
-    if da>int(d[0]):
-        dat=da-int(d[0])
-    else:
-        month-=1
-        dat=30-(int(d[0])-da)+1
+    try:
+        dob=dt.datetime.strptime(date.get().strip(),"%d-%m-%Y").date()
+    except ValueError:
+        age.config(text="Enter the date as DD-MM-YYYY")
+        return
+    if dob>today:
+        age.config(text="Date of birth is in the future")
+        return
+    # whole months to the last monthly anniversary (clamped as in
+    # dateutil's relativedelta, so 31-05 -> 30-06 is one month), then days
+    months=(today.year-dob.year)*12+today.month-dob.month
+    last=add_months(dob,months)
+    while last>today:
+        months-=1
+        last=add_months(dob,months)
+    agee,month=divmod(months,12)
+    dat=(today-last).days
     age.config(text=f"Your are {agee} years,{month} months,{dat} days old")
 root = tk.Tk()
 root.title('Find Age')
@@ -42,4 +53,5 @@ age=tk.Label(root,text="")
 age.pack(pady="5")
 btn=tk.Button(root,text="Calculate the age",command=cal)
 btn.pack(pady="5")
+root.after(3600_000,refresh_today)
 root.mainloop()
\ No newline at end of file
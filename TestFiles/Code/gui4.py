@@ -1,20 +1,101 @@
 import tkinter as tk
+from itertools import count
 from tkinter import ttk, messagebox
 
-# In-memory list to store books
-books = []
+# In-memory store of books, keyed by their Treeview iid
+books = {}
+book_ids = count(1)
+
+# Books currently listed (all of them, or the last search results); only
+# the rows from `top` that fit in the table are materialized as Tk items
+view = []
+top = 0
+ROW_HEIGHT = 20
+
+# Row values currently shown in the table, keyed by Treeview iid
+shown = {}
+
+# Search index: every suffix of every lowercase title/author token maps to
+# the set of book iids containing it, so a substring query is one walk.
+# The cost is memory: a token of length L adds O(L^2) nodes, which is fine
+# for short titles and names but grows quickly for long single tokens
+class SearchTrie:
+    def __init__(self):
+        self.root = {}
+
+    def add(self, word, iid):
+        for start in range(len(word)):
+            node = self.root
+            for ch in word[start:]:
+                node = node.setdefault(ch, {})
+                node.setdefault(None, set()).add(iid)
+
+    def remove(self, word, iid):
+        for start in range(len(word)):
+            node = self.root
+            for ch in word[start:]:
+                child = node.get(ch)
+                if child is None:
+                    # already pruned while removing another of the book's words
+                    break
+                child[None].discard(iid)
+                if not child[None]:
+                    # a node's postings include everything below it, so an
+                    # empty set means the whole branch can go
+                    del node[ch]
+                    break
+                node = child
+
+    def find(self, keyword):
+        node = self.root
+        for ch in keyword:
+            node = node.get(ch)
+            if node is None:
+                return set()
+        return node.get(None, set())
+
+trie = SearchTrie()
+
+def book_words(book):
+    return set((book['title_lower'] + " " + book['author_lower']).split())
+
+def index_book(book):
+    for word in book_words(book):
+        trie.add(word, book['id'])
+
+def unindex_book(book):
+    for word in book_words(book):
+        trie.remove(word, book['id'])
+
+# Current stripped text of each form field, kept up to date by variable
+# traces so handlers do not have to read every field back from Tk
+form_state = {'title': "", 'author': "", 'stock': "", 'search': ""}
+
+def track(name, var):
+    def on_write(*_):
+        form_state[name] = var.get().strip()
+    var.trace_add("write", on_write)
+
+def parse_stock(text):
+    # Plain ASCII digits only, as before; int() alone would also take
+    # "+5", "1_000" or non-ASCII digits
+    return int(text) if text.isascii() and text.isdigit() else None
 
 # Functions
 def add_book():
-    title = title_var.get().strip()
-    author = author_var.get().strip()
-    stock = stock_var.get().strip()
+    title, author = form_state['title'], form_state['author']
+    stock = parse_stock(form_state['stock'])
 
-    if not title or not author or not stock.isdigit():
+    if not title or not author or stock is None:
         messagebox.showwarning("Invalid Input", "Enter valid title, author, and numeric stock.")
         return
 
-    books.append({'title': title, 'author': author, 'stock': int(stock)})
+    book = {'id': str(next(book_ids)), 'title': title, 'author': author, 'stock': stock,
+            'title_lower': title.lower(), 'author_lower': author.lower()}
+    # One haystack covers both fields; the NUL keeps matches from spanning them
+    book['hay'] = book['title_lower'] + "\0" + book['author_lower']
+    books[book['id']] = book
+    index_book(book)
     clear_fields()
     display_books()
 
@@ -24,13 +105,12 @@ def update_stock():
         messagebox.showwarning("No Selection", "Select a book to update.")
         return
 
-    stock = stock_var.get().strip()
-    if not stock.isdigit():
+    stock = parse_stock(form_state['stock'])
+    if stock is None:
         messagebox.showwarning("Invalid Input", "Stock must be a number.")
         return
 
-    index = tree.index(selected)
-    books[index]['stock'] = int(stock)
+    books[selected[0]]['stock'] = stock
     clear_fields()
     display_books()
 
@@ -40,22 +120,109 @@ def delete_book():
         messagebox.showwarning("No Selection", "Select a book to delete.")
         return
 
-    index = tree.index(selected)
-    del books[index]
+    unindex_book(books.pop(selected[0]))
     display_books()
 
+# Typing in the search box schedules a search; each keystroke within the
+# delay replaces the pending one, so a burst of typing runs a single search
+SEARCH_DELAY_MS = 150
+pending_search = None
+
+def schedule_search(*_):
+    global pending_search
+    if pending_search is not None:
+        root.after_cancel(pending_search)
+    pending_search = root.after(SEARCH_DELAY_MS, search_books)
+
 def search_books():
-    keyword = search_var.get().strip().lower()
-    results = [
-        book for book in books
-        if keyword in book['title'].lower() or keyword in book['author'].lower()
-    ]
+    global pending_search
+    if pending_search is not None:
+        root.after_cancel(pending_search)
+        pending_search = None
+    keyword = form_state['search'].lower()
+    if not keyword:
+        display_books()
+        return
+    if len(keyword.split()) > 1:
+        # Phrases span tokens, so they are matched against the full fields
+        results = [book for book in books.values() if keyword in book['hay']]
+    else:
+        results = [books[iid] for iid in sorted(trie.find(keyword), key=int)]
     display_books(results)
 
 def display_books(book_list=None):
-    tree.delete(*tree.get_children())
-    for book in (book_list if book_list is not None else books):
-        tree.insert("", tk.END, values=(book['title'], book['author'], book['stock']))
+    global view, top
+    if book_list is not None:
+        # A new search result starts at its first match; refreshes after
+        # add/update/delete keep the current scroll offset
+        view = book_list
+        top = 0
+    else:
+        # Snapshot the books once per refresh so each scroll step can slice
+        # its window directly instead of walking the dict from the start
+        view = list(books.values())
+    render_rows()
+
+def visible_rows():
+    # One row's worth of height is left for the column headings
+    return max(1, tree.winfo_height() // ROW_HEIGHT - 1)
+
+def render_rows():
+    global top
+    fit = visible_rows()
+    top = max(0, min(top, len(view) - fit))
+    window = view[top:top + fit]
+    if view:
+        scrollbar.set(top / len(view), (top + len(window)) / len(view))
+    else:
+        scrollbar.set(0, 1)
+
+    # Diff against the rows already in the table so that only rows whose
+    # presence, position or values changed cost a Tk call
+    rows = [
+        (book['id'], (book['title'], book['author'], book['stock']))
+        for book in window
+    ]
+    wanted = {iid for iid, _ in rows}
+    children = list(tree.get_children())
+    gone = [iid for iid in children if iid not in wanted]
+    if gone:
+        tree.delete(*gone)
+        for iid in gone:
+            del shown[iid]
+        children = [iid for iid in children if iid in wanted]
+
+    for pos, (iid, values) in enumerate(rows):
+        if iid not in shown:
+            tree.insert("", pos, iid=iid, values=values)
+            children.insert(pos, iid)
+        else:
+            if shown[iid] != values:
+                tree.item(iid, values=values)
+            if pos >= len(children) or children[pos] != iid:
+                tree.move(iid, "", pos)
+                if iid in children:
+                    children.remove(iid)
+                children.insert(pos, iid)
+        shown[iid] = values
+
+def scroll_rows(action, amount, unit=None):
+    global top
+    if action == "moveto":
+        top = int(float(amount) * len(view))
+    elif unit == "pages":
+        top += int(amount) * visible_rows()
+    else:
+        top += int(amount)
+    render_rows()
+
+def on_mousewheel(event):
+    # Windows/macOS report a signed delta, X11 sends buttons 4 and 5
+    if event.num == 4 or event.delta > 0:
+        scroll_rows("scroll", -3, "units")
+    else:
+        scroll_rows("scroll", 3, "units")
+    return "break"
 
 def clear_fields():
     title_var.set("")
@@ -72,6 +239,11 @@ title_var = tk.StringVar()
 author_var = tk.StringVar()
 stock_var = tk.StringVar()
 search_var = tk.StringVar()
+track('title', title_var)
+track('author', author_var)
+track('stock', stock_var)
+track('search', search_var)
+search_var.trace_add("write", schedule_search)
 
 # Input Frame
 form = tk.Frame(root)
@@ -98,10 +270,17 @@ tk.Button(search_frame, text="Search", command=search_books).pack(side=tk.LEFT)
 tk.Button(search_frame, text="Show All", command=display_books).pack(side=tk.LEFT)
 
 # Table
+ttk.Style().configure("Treeview", rowheight=ROW_HEIGHT)
+scrollbar = ttk.Scrollbar(root, orient=tk.VERTICAL, command=scroll_rows)
+scrollbar.pack(side=tk.RIGHT, fill=tk.Y, pady=10)
 tree = ttk.Treeview(root, columns=("Title", "Author", "Stock"), show="headings")
 tree.heading("Title", text="Title")
 tree.heading("Author", text="Author")
 tree.heading("Stock", text="Stock")
 tree.pack(pady=10, fill=tk.BOTH, expand=True)
+tree.bind("<MouseWheel>", on_mousewheel)
+tree.bind("<Button-4>", on_mousewheel)
+tree.bind("<Button-5>", on_mousewheel)
+tree.bind("<Configure>", lambda event: render_rows())
 
 root.mainloop()
@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
 
@@ -16,28 +17,48 @@ data = {
 df = pd.DataFrame(data)
 print(df)
 # Step 2: Save to CSV
+# The CSV is only an output artifact; the steps below keep using the
+# in-memory df rather than re-parsing the file
 csv_filename = 'sales_data.csv'
 df.to_csv(csv_filename, index=False)
 
-# Step 3: Read the data from CSV
-df = pd.read_csv(csv_filename)
+# Step 3: Calculate total sales per product
+# Factorize product ids into dense codes, then sum with one bincount pass
+codes, product_ids = pd.factorize(df['product_id'], sort=True)
+total_sales = np.bincount(codes, weights=df['sales_amount'].to_numpy())
 
-# Step 4: Calculate total sales per product
-total_sales = df.groupby('product_id')['sales_amount'].sum()
+# Step 4: Sort the products by total sales
+order = np.argsort(-total_sales, kind='stable')
 
-# Step 5: Sort the products by total sales
-sorted_sales = total_sales.sort_values(ascending=False)
+# Step 5: Plot the bar graph
+# The figure is created once; refreshing with new totals updates the
+# existing bars in place instead of rebuilding the figure and its layout
+fig, ax = plt.subplots(figsize=(8, 5))
+ax.set_title('Total Sales per Product')
+ax.set_xlabel('Product ID')
+ax.set_ylabel('Total Sales Amount')
+bars = None
 
-# Step 6: Plot the bar graph
-plt.figure(figsize=(8, 5))
-sorted_sales.plot(kind='bar', color='skyblue')
-plt.title('Total Sales per Product')
-plt.xlabel('Product ID')
-plt.ylabel('Total Sales Amount')
-plt.xticks(rotation=0)
-plt.tight_layout()
+def plot_sales(ids, totals):
+    global bars
+    positions = np.arange(len(totals))
+    if bars is None or len(bars) != len(totals):
+        if bars is not None:
+            bars.remove()
+        bars = ax.bar(positions, totals, color='skyblue')
+        ax.set_xticks(positions)
+        fig.tight_layout()
+    else:
+        for bar, height in zip(bars, totals):
+            bar.set_height(height)
+    ax.relim()
+    ax.autoscale_view()
+    ax.set_xticklabels(ids.astype(str), rotation=0)
+    fig.canvas.draw_idle()
 
-# Step 7: Save the plot as an image
+plot_sales(product_ids[order], total_sales[order])
+
+# Step 6: Save the plot as an image
 plot_filename = 'total_sales_per_product.png'
-plt.savefig(plot_filename)
+fig.savefig(plot_filename)
 plt.show()
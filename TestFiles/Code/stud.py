@@ -13,27 +13,47 @@ for i in range (0,data.shape[0]):
 plt.scatterplot(avg)
 plt.xlabel=
 print(avg)"""
+import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
 
 # Step 1: Read the CSV file
-df = pd.read_csv("st.csv")
+df = pd.read_csv("st.csv", engine="pyarrow")
 
 # Step 2: Calculate average marks for each student
 # Assuming the first column is 'Name' and the rest are subject marks
-df['Average'] = df.iloc[:, 1:].mean(axis=1)
+# Reduce on the raw NumPy buffer instead of the DataFrame machinery; marks
+# stay float64 so fractional marks like 78.4 are not rounded to float32
+marks = df.iloc[:, 1:].to_numpy(dtype=np.float64)
+df['Average'] = marks.mean(axis=1)
 print(df)
 # Step 3: Plot the average marks
+# The figure and scatter are created once; refreshing moves the existing
+# points instead of rebuilding the figure
 #plt.figure(figsize=(10, 6))
-plt.scatter(df['Name'], df['Average'], color='blue', edgecolors='black')
+fig, ax = plt.subplots()
+points = ax.scatter([], [], color='blue', edgecolors='black')
 
 # Step 4: Add labels and title
-plt.xlabel("Student Name")
-plt.ylabel("Average Mark")
-plt.title("Average Marks of Students")
-plt.xticks(rotation=45)
-plt.grid(True)
+ax.set_xlabel("Student Name")
+ax.set_ylabel("Average Mark")
+ax.set_title("Average Marks of Students")
+ax.grid(True)
 #plt.tight_layout()
 
+def plot_averages(names, averages):
+    positions = np.arange(len(names))
+    offsets = np.column_stack((positions, averages))
+    points.set_offsets(offsets)
+    ax.set_xticks(positions)
+    ax.set_xticklabels(names, rotation=45)
+    # relim() skips collections, so reset the data limits from the points
+    ax.ignore_existing_data_limits = True
+    ax.update_datalim(offsets)
+    ax.autoscale_view()
+    fig.canvas.draw_idle()
+
+plot_averages(df['Name'].to_numpy(), df['Average'].to_numpy())
+
 # Step 5: Show the plot
 plt.show()
\ No newline at end of file